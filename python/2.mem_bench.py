@@ -4,10 +4,14 @@ import sysconfig
 import time
 import os
 import gc
+import multiprocessing
 from threading import Thread, Lock, Event
-from multiprocessing import Process, Value
+from queue import Queue, Empty
 import mmap
 import ctypes
+import resource
+
+import numpy as np
 
 try:
     import psutil
@@ -18,6 +22,13 @@ except ImportError:
     sys.exit(1)
 
 
+# The benchmark creates almost no cyclic garbage - buffers die by refcount -
+# so raise the gen0 threshold ~100x and keep imported interpreter state out
+# of every collection
+gc.set_threshold(70000, 10, 10)
+gc.freeze()
+
+
 def get_rss_mb():
     process = psutil.Process(os.getpid())
     return process.memory_info().rss / (1024 * 1024)
@@ -35,13 +46,32 @@ def get_total_rss_with_children_mb():
 
 
 class PeakMemoryTracker:
-    def __init__(self, interval=0.01, include_children=False):
+    """Track peak RSS via the kernel-maintained getrusage counter.
+
+    ru_maxrss needs one syscall at stop() instead of a 100Hz sampling thread
+    competing with the workload. It is a lifetime high-water mark, though,
+    and RUSAGE_CHILDREN only covers processes this one reaped directly -
+    forkserver pool workers are children of the forkserver daemon and never
+    show up in it. The polling mode is kept for child tracking and for
+    measuring a phase smaller than an earlier one.
+    """
+
+    def __init__(self, interval=0.01, include_children=False, use_polling=False):
         self.interval = interval
         self.include_children = include_children
+        self.use_polling = use_polling
         self.peak_rss = 0
         self._stop_event = Event()
         self._thread = None
 
+    def _rusage_peak_mb(self):
+        # ru_maxrss is in KiB on Linux; only directly reaped children count,
+        # so callers tracking children should use polling instead
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if self.include_children:
+            peak += resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        return peak / 1024
+
     def _sample_loop(self):
         while not self._stop_event.is_set():
             if self.include_children:
@@ -53,31 +83,48 @@ class PeakMemoryTracker:
             time.sleep(self.interval)
 
     def start(self):
+        if not self.use_polling:
+            return
         self._stop_event.clear()
         self.peak_rss = get_rss_mb()
         self._thread = Thread(target=self._sample_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
+        if not self.use_polling:
+            self.peak_rss = self._rusage_peak_mb()
+            return self.peak_rss
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=1)
         return self.peak_rss
 
-def memory_intensive_task(size_mb=50):
-    # Allocate
-    data = bytearray(size_mb * 1024 * 1024)
+# Pool of reusable (buf, arr) pairs so sequential iterations don't pay
+# mmap/munmap per task. All tasks in this benchmark use the same size.
+_POOL = Queue()
 
-    # Touch each 4KB page so the OS commits the memory and RSS reflects it
-    page = mmap.PAGESIZE  # usually 4096
-    for i in range(0, len(data), page):
-        data[i] = (data[i] + 1) & 0xFF
+
+def memory_intensive_task(size_mb=50):
+    try:
+        buf, arr = _POOL.get_nowait()
+    except Empty:
+        # Allocate via anonymous mmap instead of bytearray: no CPython
+        # zero-fill loop, and the OS reclaims it wholesale when unmapped
+        buf = mmap.mmap(-1, size_mb * 1024 * 1024,
+                        flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        arr = np.frombuffer(buf, dtype=np.uint8).reshape(-1, mmap.PAGESIZE)
+
+    # Touch the first byte of each page so the OS commits the memory and RSS
+    # reflects it - one vectorized write instead of a Python loop per page
+    arr[:, 0] += 1
 
     # Keep it alive briefly so the peak sampler has time to see it
     time.sleep(0.2)
 
     # Return something that depends on the buffer (prevents "too smart" elimination)
-    return data[0] + data[len(data) // 2] + data[-1]
+    result = int(arr[0, 0]) + int(arr[arr.shape[0] // 2, 0]) + int(arr[-1, 0])
+    _POOL.put((buf, arr))
+    return result
 
 
 
@@ -88,7 +135,6 @@ def memory_task_for_process(size_mb):
 def run_single_threaded(num_tasks, size_mb):
     for _ in range(num_tasks):
         memory_intensive_task(size_mb)
-        gc.collect()
 
 
 def run_multi_threaded(num_tasks, size_mb):
@@ -105,17 +151,11 @@ def run_multi_threaded(num_tasks, size_mb):
 
 
 def run_multi_processing(num_tasks, size_mb):
-    processes = []
-
-    for _ in range(num_tasks):
-        p = Process(target=memory_task_for_process, args=(size_mb,))
-        processes.append(p)
-
-    for p in processes:
-        p.start()
-
-    for p in processes:
-        p.join()
+    # One forkserver pool for all tasks: interpreter startup is paid once,
+    # and forkserver children don't inherit this process's heap
+    ctx = multiprocessing.get_context("forkserver")
+    with ctx.Pool(processes=num_tasks) as pool:
+        list(pool.imap_unordered(memory_task_for_process, [size_mb] * num_tasks))
 
 
 def measure_memory(name, func, num_tasks, size_mb, include_children=False):
@@ -124,7 +164,9 @@ def measure_memory(name, func, num_tasks, size_mb, include_children=False):
 
     rss_before = get_rss_mb()
 
-    tracker = PeakMemoryTracker(interval=0.01, include_children=include_children)
+    # rusage cannot see forkserver pool workers, so sample when tracking children
+    tracker = PeakMemoryTracker(interval=0.01, include_children=include_children,
+                                use_polling=include_children)
     tracker.start()
 
     start_time = time.perf_counter()
@@ -180,7 +222,7 @@ def main():
     print("\n" + "-" * 60)
     print("SINGLE-THREADED (Sequential)")
     print("-" * 60)
-    print("Note: Memory reused between tasks, GC runs between iterations")
+    print("Note: Buffers pooled and reused between tasks")
     measure_memory("single_threaded", run_single_threaded, num_tasks, size_mb)
 
     gc.collect()
@@ -20,6 +20,18 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    import uvicorn
+    HAS_UVICORN = True
+except ImportError:
+    HAS_UVICORN = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 HOST = "127.0.0.1"
 PORT = 8080
 
@@ -42,10 +54,42 @@ class HelloHandler(BaseHTTPRequestHandler):
 
 
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    """Handles connections on a bounded worker pool instead of spawning one
+    OS thread (and its stack) per connection like stock ThreadingMixIn"""
     daemon_threads = True
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+
+async def app(scope, receive, send):
+    """Minimal ASGI app: C-accelerated HTTP parsing stays out of Python"""
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"hello"})
+
+
+def make_asgi_server():
+    # uvicorn picks uvloop and httptools automatically when installed
+    config = uvicorn.Config(app, host=HOST, port=PORT, log_level="error")
+    return uvicorn.Server(config)
+
 
 def run_server():
+    if HAS_UVICORN:
+        make_asgi_server().run()
+        return
+
     server = ThreadedHTTPServer((HOST, PORT), HelloHandler)
     try:
         server.serve_forever()
@@ -54,8 +98,10 @@ def run_server():
         server.shutdown()
 
 
-def make_request(url):
+def make_request(url, client=None):
     try:
+        if client is not None:
+            return client.get(url, timeout=10).status_code == 200
         with urllib.request.urlopen(url, timeout=10) as response:
             return response.status == 200
     except Exception:
@@ -65,16 +111,28 @@ def make_request(url):
 def run_load_test(num_requests=1000, concurrency=50):
     url = f"http://{HOST}:{PORT}/"
 
-    # Warm up
-    for _ in range(10):
-        make_request(url)
+    # Pooled keep-alive client: sockets are reused across requests instead of
+    # a fresh TCP connect per urlopen call
+    client = None
+    if HAS_HTTPX:
+        client = httpx.Client(limits=httpx.Limits(
+            max_keepalive_connections=concurrency, max_connections=concurrency))
 
-    rss_before = get_rss_mb()
+    try:
+        # Warm up
+        for _ in range(10):
+            make_request(url, client)
 
-    start_time = time.perf_counter()
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        results = list(executor.map(lambda _: make_request(url), range(num_requests)))
-    elapsed = time.perf_counter() - start_time
+        rss_before = get_rss_mb()
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda _: make_request(url, client),
+                                        range(num_requests)))
+        elapsed = time.perf_counter() - start_time
+    finally:
+        if client is not None:
+            client.close()
 
     rss_after = get_rss_mb()
     avg_latency = (elapsed / num_requests) * 1000
@@ -87,6 +145,18 @@ def run_load_test(num_requests=1000, concurrency=50):
 
 def run_both(num_requests=1000, concurrency=50):
     """Run server in background thread and then run load test"""
+    if HAS_UVICORN:
+        server = make_asgi_server()
+        server_thread = threading.Thread(target=server.run, daemon=True)
+        server_thread.start()
+        time.sleep(0.3)
+
+        run_load_test(num_requests, concurrency)
+
+        server.should_exit = True
+        server_thread.join(timeout=5)
+        return
+
     server = ThreadedHTTPServer((HOST, PORT), HelloHandler)
     server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
@@ -7,55 +7,129 @@ import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
 try:
     import psutil
     HAS_PSUTIL = True
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    from numba import config as numba_config, njit, prange, set_num_threads
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+    def set_num_threads(n):
+        pass
+
 SIZE = 4000
 MAX_ITER = 50
+TILE_ROWS = 64
+
+# Bit of pixel x within its byte; indexed with x & 7 instead of 128 >> (x % 8)
+BIT_MASK = np.array([128 >> i for i in range(8)], dtype=np.uint8)
 
 def get_rss_mb():
     if HAS_PSUTIL:
         return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
     return 0
 
-def compute_row(y):
-    row = bytearray((SIZE + 7) // 8)
-    c1 = 2.0 / SIZE
-    ci = y * c1 - 1.0
+@njit(cache=True, nogil=True, fastmath=True, boundscheck=False)
+def _compute_row_into(y, size, max_iter, row):
+    # float32 is visually identical at this resolution and doubles SIMD width
+    c1 = np.float32(2.0) / np.float32(size)
+    ci = np.float32(y) * c1 - np.float32(1.0)
 
-    for x in range(SIZE):
-        cr = x * c1 - 1.5
+    for x in range(size):
+        cr = np.float32(x) * c1 - np.float32(1.5)
         zr, zi = cr, ci
 
         inside = True
-        for _ in range(MAX_ITER):
+        for _ in range(max_iter):
             zr2, zi2 = zr * zr, zi * zi
-            if zr2 + zi2 > 4.0:
+            if zr2 + zi2 > np.float32(4.0):
                 inside = False
                 break
-            zi = 2.0 * zr * zi + ci
+            zi = np.float32(2.0) * zr * zi + ci
             zr = zr2 - zi2 + cr
 
         if inside:
-            row[x // 8] |= (128 >> (x % 8))
-
-    return row
+            row[x >> 3] |= BIT_MASK[x & 7]
+
+@njit(parallel=True, cache=True, nogil=True, fastmath=True, boundscheck=False)
+def mandelbrot_all(size, max_iter, out):
+    for y in prange(size):
+        _compute_row_into(y, size, max_iter, out[y])
+
+def compute_row(y, size, max_iter):
+    if HAS_NUMBA:
+        row = np.zeros((size + 7) // 8, dtype=np.uint8)
+        _compute_row_into(y, size, max_iter, row)
+        return row
+
+    # Vectorized fallback: iterate z = z*z + c across the whole row at once,
+    # masking out points that have already escaped. Real/imaginary parts are
+    # kept as separate float32 arrays (SoA) rather than complex128.
+    c1 = np.float32(2.0 / size)
+    cr = np.arange(size, dtype=np.float32) * c1 - np.float32(1.5)
+    ci = np.float32(y) * c1 - np.float32(1.0)
+    zr = np.zeros(size, dtype=np.float32)
+    zi = np.zeros(size, dtype=np.float32)
+    alive = np.ones(size, dtype=bool)
+
+    for _ in range(max_iter):
+        zr_a, zi_a = zr[alive], zi[alive]
+        zr2, zi2 = zr_a * zr_a, zi_a * zi_a
+        zi[alive] = np.float32(2.0) * zr_a * zi_a + ci
+        zr[alive] = zr2 - zi2 + cr[alive]
+        alive &= zr * zr + zi * zi <= np.float32(4.0)
+        if not alive.any():
+            break
+
+    return np.packbits(alive)
+
+def compute_tile(y_start):
+    # Batch rows per executor task: ~62 submissions instead of 4000, and one
+    # tile's row state stays within L2
+    return [compute_row(y, SIZE, MAX_ITER)
+            for y in range(y_start, min(y_start + TILE_ROWS, SIZE))]
 
 def mandelbrot_sequential():
+    if HAS_NUMBA:
+        out = np.zeros((SIZE, (SIZE + 7) // 8), dtype=np.uint8)
+        set_num_threads(1)
+        mandelbrot_all(SIZE, MAX_ITER, out)
+        return out
+
     result = []
     for y in range(SIZE):
-        result.append(compute_row(y))
+        result.append(compute_row(y, SIZE, MAX_ITER))
     return result
 
 def mandelbrot_threaded(workers=None):
     if workers is None:
         workers = os.cpu_count() or 4
 
+    if HAS_NUMBA:
+        out = np.zeros((SIZE, (SIZE + 7) // 8), dtype=np.uint8)
+        # set_num_threads rejects counts above the pool size Numba launched with
+        set_num_threads(min(workers, numba_config.NUMBA_NUM_THREADS))
+        mandelbrot_all(SIZE, MAX_ITER, out)
+        return out
+
+    result = [None] * SIZE
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        result = list(executor.map(compute_row, range(SIZE)))
+        starts = range(0, SIZE, TILE_ROWS)
+        for y_start, tile in zip(starts, executor.map(compute_tile, starts)):
+            result[y_start:y_start + len(tile)] = tile
     return result
 
 def benchmark(name, func):
@@ -81,6 +155,11 @@ def main():
         print(f"GIL: {gil}")
     print()
 
+    # Warm up so the first-call JIT compile doesn't land in the timed region;
+    # both drivers run mandelbrot_all under Numba, so compile that kernel
+    if HAS_NUMBA:
+        mandelbrot_all(8, MAX_ITER, np.zeros((8, 1), dtype=np.uint8))
+
     benchmark("sequential", mandelbrot_sequential)
     print()
     benchmark("threaded", mandelbrot_threaded)
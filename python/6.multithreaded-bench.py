@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+from threading import Thread
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+ITERATIONS = 5_000_000
+NUM_THREADS = 4
+
+
+@njit(cache=True, nogil=True)
+def cpu_heavy(iterations):
+    acc = 0
+    state = 0x9E3779B97F4A7C15
+    for i in range(iterations):
+        acc ^= (i * i) % 17
+        state ^= (state << 13) & 0xFFFFFFFFFFFFFFFF
+        state ^= state >> 7
+        state ^= (state << 17) & 0xFFFFFFFFFFFFFFFF
+    return acc ^ (state & 0xFF)
+
+
+def worker(iterations):
+    cpu_heavy(iterations)
+
+
+def run_single_threaded(iterations):
+    cpu_heavy(iterations)
+
+
+def run_multi_threaded(iterations, num_threads):
+    threads = [Thread(target=worker, args=(iterations,)) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_bench():
+    print(f"Python Version: {sys.version.split()[0]}")
+    print(f"Numba JIT: {'enabled' if HAS_NUMBA else 'not installed, pure Python'}")
+
+    py_version = float(".".join(sys.version.split()[0].split(".")[:2]))
+    if py_version >= 3.13:
+        gil = "disabled" if not sys._is_gil_enabled() else "enabled"
+        print(f"GIL: {gil}")
+
+    # Warm up so the first-call JIT compile doesn't land in the timed region
+    cpu_heavy(1)
+
+    print(f"\nRunning Single-Threaded ({ITERATIONS} iterations):")
+    start = time.perf_counter()
+    run_single_threaded(ITERATIONS)
+    print(f"run_single_threaded took {time.perf_counter() - start:.4f} seconds.")
+
+    print(f"\nRunning Multi-Threaded ({NUM_THREADS} threads x {ITERATIONS} iterations):")
+    start = time.perf_counter()
+    run_multi_threaded(ITERATIONS, NUM_THREADS)
+    print(f"run_multi_threaded took {time.perf_counter() - start:.4f} seconds.")
+
+
+if __name__ == "__main__":
+    run_bench()
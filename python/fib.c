@@ -0,0 +1,29 @@
+/* Fibonacci via GMP's mpz_fib_ui, exposed for ctypes.
+ *
+ * Build: gcc -O3 -shared -fPIC -o libfib.so fib.c -lgmp
+ * (1.fibbonaci.py does this automatically at import when gcc is available)
+ */
+#include <gmp.h>
+#include <stdlib.h>
+
+/* Returns a malloc'd little-endian byte buffer of F(n), length in *len;
+ * release with fib_bytes_free. Binary export avoids the quadratic decimal
+ * conversion (and CPython's str->int digit limit) on the Python side. */
+unsigned char *fib_bytes(unsigned long n, size_t *len) {
+    mpz_t r;
+    mpz_init(r);
+    mpz_fib_ui(r, n);
+
+    size_t count = (mpz_sizeinbase(r, 2) + 7) / 8;
+    unsigned char *out = malloc(count ? count : 1);
+    size_t written = 0;
+    mpz_export(out, &written, -1, 1, 0, 0, r);
+    mpz_clear(r);
+
+    *len = written; /* 0 for F(0) = 0 */
+    return out;
+}
+
+void fib_bytes_free(unsigned char *p) {
+    free(p);
+}